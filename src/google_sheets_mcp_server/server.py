@@ -6,17 +6,25 @@ This server implements the Model Context Protocol (MCP) over HTTP with Streamabl
 providing Google Sheets integration capabilities for Dify and other MCP clients.
 """
 
+import asyncio
 import base64
+import gzip
 import os
 import json
 import logging
 import hashlib
 import secrets
-from typing import List, Dict, Any, Optional, Union
-from dataclasses import dataclass
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Union
+from dataclasses import dataclass, field
 from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator
 
+import uvicorn
+
 # MCP imports
 from mcp.server.fastmcp import FastMCP, Context
 
@@ -28,76 +36,246 @@ from google.oauth2.credentials import Credentials
 from google.oauth2 import service_account
 from google.auth.transport.requests import Request as GoogleRequest
 from google_auth_oauthlib.flow import InstalledAppFlow
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 import google.auth
+import httplib2
+
+# orjson is an optional C-accelerated JSON encoder, used to serialize bulk
+# write bodies in one pass instead of stdlib json's per-cell encode
+try:
+    import orjson
+except ImportError:  # optional accelerator, stdlib json is the fallback
+    orjson = None
 
 # Configuration and logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Constants
-SCOPES = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
-CREDENTIALS_CONFIG = os.environ.get('CREDENTIALS_CONFIG')
-TOKEN_PATH = os.environ.get('TOKEN_PATH', 'token.json')
-CREDENTIALS_PATH = os.environ.get('CREDENTIALS_PATH', 'credentials.json')
-SERVICE_ACCOUNT_PATH = os.environ.get('SERVICE_ACCOUNT_PATH', 'service-account-key.json')
-DRIVE_FOLDER_ID = os.environ.get('DRIVE_FOLDER_ID', '')  # Working directory in Google Drive
-
-# API Key for authentication
-API_KEY = os.environ.get('MCP_API_KEY')
-if not API_KEY:
-    # Generate a secure API key if not provided
-    API_KEY = secrets.token_urlsafe(32)
-    logger.warning(f"No MCP_API_KEY provided. Generated temporary key: {API_KEY}")
-    logger.warning("Set MCP_API_KEY environment variable for production use")
-
-
-@dataclass
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Server configuration, resolved from the environment once at import."""
+    scopes: Tuple[str, ...]
+    credentials_config: Optional[str]
+    token_path: str
+    credentials_path: str
+    service_account_path: str
+    drive_folder_id: str  # Working directory in Google Drive
+    api_key: str
+    port: int
+    debug: bool
+    workers: int
+
+
+def _load_config() -> Config:
+    """Read every environment knob in one place and freeze the result."""
+    api_key = os.environ.get('MCP_API_KEY')
+    if not api_key:
+        # Generate a secure API key if not provided
+        api_key = secrets.token_urlsafe(32)
+        logger.warning(f"No MCP_API_KEY provided. Generated temporary key: {api_key}")
+        logger.warning("Set MCP_API_KEY environment variable for production use")
+
+    return Config(
+        scopes=('https://www.googleapis.com/auth/spreadsheets',
+                'https://www.googleapis.com/auth/drive'),
+        credentials_config=os.environ.get('CREDENTIALS_CONFIG'),
+        token_path=os.environ.get('TOKEN_PATH', 'token.json'),
+        credentials_path=os.environ.get('CREDENTIALS_PATH', 'credentials.json'),
+        service_account_path=os.environ.get('SERVICE_ACCOUNT_PATH', 'service-account-key.json'),
+        drive_folder_id=os.environ.get('DRIVE_FOLDER_ID', ''),
+        api_key=api_key,
+        port=int(os.environ.get('PORT', 8000)),
+        debug=os.environ.get('DEBUG', 'false').lower() == 'true',
+        workers=int(os.environ.get('WEB_CONCURRENCY', 1)),
+    )
+
+
+CONFIG = _load_config()
+
+# Refresh credentials this many seconds before they expire so tool calls
+# never pay the token-refresh round trip on the request hot path
+TOKEN_REFRESH_LEAD_SECONDS = 300
+
+# Serializes credential refreshes between the background refresher and any
+# on-demand refresh triggered from a worker thread
+_refresh_lock = threading.Lock()
+
+# How long cached sheet-name lists stay valid; Dify clients often call
+# list_sheets before every read/write, so even a short TTL saves most calls
+SHEET_NAMES_CACHE_TTL = 30.0
+
+# Request bodies below this size are cheaper to send uncompressed
+GZIP_MIN_BODY_BYTES = 1024
+
+# Pre-hash the key once so validation compares fixed-size digests instead of
+# variable-length strings (hashlib dispatches to hardware SHA where available)
+_API_KEY_DIGEST = hashlib.sha256(CONFIG.api_key.encode()).digest()
+
+
+# slots=True gives C-level descriptor attribute access on the hot path
+@dataclass(slots=True)
 class SpreadsheetContext:
     """Context for Google Spreadsheet service"""
     sheets_service: Any
     drive_service: Any
     folder_id: Optional[str] = None
+    # spreadsheet_id -> (fetch timestamp, sheet names); see list_sheets
+    sheet_names_cache: Dict[str, Tuple[float, List[str]]] = field(default_factory=dict)
+
+
+def _save_token(creds) -> None:
+    """Atomically persist OAuth credentials so the next start skips a refresh.
+
+    Only user OAuth credentials are file-backed; service account and ADC
+    credentials are ignored. The write goes through a temp file plus
+    os.replace so a crash mid-write can never corrupt the token file.
+    """
+    if not isinstance(creds, Credentials):
+        return
+    try:
+        tmp_path = CONFIG.token_path + '.tmp'
+        with open(tmp_path, 'w') as token:
+            token.write(creds.to_json())
+        os.replace(tmp_path, CONFIG.token_path)
+        logger.info(f"Saved OAuth credentials to {CONFIG.token_path}")
+    except Exception as e:
+        logger.error(f"Error saving OAuth token: {e}")
+
+
+def _install_single_flight_refresh(creds) -> None:
+    """Serialize credential refreshes so concurrent expiry costs one round trip.
+
+    Multiple tool calls hitting a just-expired token would each trigger
+    creds.refresh() inside AuthorizedHttp on their worker threads. Wrap
+    refresh so callers queue on the shared lock, and any caller that finds
+    the token already renewed by whoever held the lock first returns
+    without an extra request to Google's OAuth endpoint.
+    """
+    inner_refresh = creds.refresh
+
+    def refresh(request):
+        expiry_before = creds.expiry
+        with _refresh_lock:
+            if creds.expiry != expiry_before and creds.valid:
+                # Another thread refreshed while we waited for the lock
+                return
+            inner_refresh(request)
+            _save_token(creds)
+
+    creds.refresh = refresh
+
+
+def _refresh_credentials(creds) -> None:
+    """Preemptively refresh credentials (runs in an executor thread).
+
+    Locking and token persistence happen inside the wrapped creds.refresh.
+    """
+    creds.refresh(GoogleRequest())
+    logger.info("Refreshed Google credentials in background")
+
+
+async def _refresh_loop(creds) -> None:
+    """Preemptively refresh credentials shortly before they expire.
+
+    Both OAuth and service account tokens expire (~1 hour); refreshing in the
+    background keeps the periodic refresh latency off the tool-call hot path.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        expiry = creds.expiry
+        if expiry is None:
+            # Credentials have not fetched a token yet; check back shortly
+            await asyncio.sleep(60)
+            continue
+        sleep_s = (expiry - datetime.utcnow()).total_seconds() - TOKEN_REFRESH_LEAD_SECONDS
+        if sleep_s > 0:
+            await asyncio.sleep(sleep_s)
+        try:
+            await loop.run_in_executor(None, _refresh_credentials, creds)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Background credential refresh failed: {e}")
+        # Avoid a tight loop if the refresh failed or tokens are short-lived
+        await asyncio.sleep(30)
 
 
 # Simple authentication helper
 def validate_api_key(provided_key: str) -> bool:
     """Validate API key using secure comparison"""
-    if not provided_key or not API_KEY:
+    if not provided_key or not CONFIG.api_key:
         return False
-    return secrets.compare_digest(provided_key, API_KEY)
+    provided_digest = hashlib.sha256(provided_key.encode()).digest()
+    return secrets.compare_digest(provided_digest, _API_KEY_DIGEST)
 
 
-@asynccontextmanager
-async def spreadsheet_lifespan(server: FastMCP) -> AsyncIterator[SpreadsheetContext]:
-    """Manage Google Spreadsheet API connection lifecycle"""
+# Process-wide context shared across MCP sessions; some FastMCP transports
+# run the lifespan per session rather than per process, and re-running auth
+# plus two service builds for every session would cost seconds each time
+_context: Optional[SpreadsheetContext] = None
+_context_lock = asyncio.Lock()
+_refresh_task: Optional[asyncio.Task] = None
+
+# Authenticated credentials shared by all connections; set by _build_context
+_credentials = None
+
+# httplib2 caches one connection per host with no locking, so a single
+# shared AuthorizedHttp would let concurrent worker threads interleave
+# send/recv on the same TLS socket. Give each thread its own instance;
+# to_thread's bounded pool keeps the connection count small and keep-alive
+# still applies within each thread.
+_thread_local = threading.local()
+
+
+def _thread_authorized_http() -> AuthorizedHttp:
+    """Return the calling thread's AuthorizedHttp, creating it on first use."""
+    authed = getattr(_thread_local, 'authed_http', None)
+    if authed is None:
+        authed = AuthorizedHttp(_credentials, http=httplib2.Http())
+        _thread_local.authed_http = authed
+    return authed
+
+
+def _execute_request(request):
+    """Execute a googleapiclient request on this thread's own connection."""
+    return request.execute(http=_thread_authorized_http())
+
+
+async def _execute(request):
+    """Run a googleapiclient request off the event loop."""
+    return await asyncio.to_thread(_execute_request, request)
+
+
+async def _build_context() -> SpreadsheetContext:
+    """Authenticate and build the Google API services (runs once per process)."""
     logger.info("Initializing Google Spreadsheet services...")
-    
+
     # Authenticate and build the service
     creds = None
 
     # Priority 1: Check for base64 encoded credentials in environment
-    if CREDENTIALS_CONFIG:
+    if CONFIG.credentials_config:
         try:
-            creds_data = json.loads(base64.b64decode(CREDENTIALS_CONFIG))
-            creds = service_account.Credentials.from_service_account_info(creds_data, scopes=SCOPES)
+            creds_data = json.loads(base64.b64decode(CONFIG.credentials_config))
+            creds = service_account.Credentials.from_service_account_info(creds_data, scopes=CONFIG.scopes)
             logger.info("Using base64 encoded service account credentials")
         except Exception as e:
             logger.error(f"Error decoding CREDENTIALS_CONFIG: {e}")
             creds = None
     
     # Priority 2: Check for explicit service account file
-    logger.info(f"Checking service account path: {SERVICE_ACCOUNT_PATH}")
-    logger.info(f"File exists: {os.path.exists(SERVICE_ACCOUNT_PATH) if SERVICE_ACCOUNT_PATH else False}")
+    logger.info(f"Checking service account path: {CONFIG.service_account_path}")
+    logger.info(f"File exists: {os.path.exists(CONFIG.service_account_path) if CONFIG.service_account_path else False}")
     
-    if not creds and SERVICE_ACCOUNT_PATH and os.path.exists(SERVICE_ACCOUNT_PATH):
+    if not creds and CONFIG.service_account_path and os.path.exists(CONFIG.service_account_path):
         try:
             creds = service_account.Credentials.from_service_account_file(
-                SERVICE_ACCOUNT_PATH,
-                scopes=SCOPES
+                CONFIG.service_account_path,
+                scopes=CONFIG.scopes
             )
-            logger.info(f"Successfully loaded service account from file: {SERVICE_ACCOUNT_PATH}")
-            logger.info(f"Working with Google Drive folder ID: {DRIVE_FOLDER_ID or 'Not specified'}")
+            logger.info(f"Successfully loaded service account from file: {CONFIG.service_account_path}")
+            logger.info(f"Working with Google Drive folder ID: {CONFIG.drive_folder_id or 'Not specified'}")
         except Exception as e:
             logger.error(f"Error using service account file: {e}")
             creds = None
@@ -105,10 +283,10 @@ async def spreadsheet_lifespan(server: FastMCP) -> AsyncIterator[SpreadsheetCont
     # Priority 3: Fall back to OAuth flow if service account auth failed
     if not creds:
         logger.info("Attempting OAuth authentication flow")
-        if os.path.exists(TOKEN_PATH):
+        if os.path.exists(CONFIG.token_path):
             try:
-                with open(TOKEN_PATH, 'r') as token:
-                    creds = Credentials.from_authorized_user_info(json.load(token), SCOPES)
+                with open(CONFIG.token_path, 'r') as token:
+                    creds = Credentials.from_authorized_user_info(json.load(token), CONFIG.scopes)
                 logger.info("Loaded existing OAuth token")
             except Exception as e:
                 logger.error(f"Error loading OAuth token: {e}")
@@ -117,7 +295,8 @@ async def spreadsheet_lifespan(server: FastMCP) -> AsyncIterator[SpreadsheetCont
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
                 try:
-                    creds.refresh(Request())
+                    creds.refresh(GoogleRequest())
+                    _save_token(creds)
                     logger.info("Refreshed OAuth token")
                 except Exception as e:
                     logger.error(f"Error refreshing OAuth token: {e}")
@@ -125,14 +304,12 @@ async def spreadsheet_lifespan(server: FastMCP) -> AsyncIterator[SpreadsheetCont
             
             if not creds:
                 try:
-                    flow = InstalledAppFlow.from_client_secrets_file(CREDENTIALS_PATH, SCOPES)
+                    flow = InstalledAppFlow.from_client_secrets_file(CONFIG.credentials_path, CONFIG.scopes)
                     creds = flow.run_local_server(port=0)
                     logger.info("Completed interactive OAuth flow")
-                    
+
                     # Save the credentials for the next run
-                    with open(TOKEN_PATH, 'w') as token:
-                        token.write(creds.to_json())
-                    logger.info(f"Saved OAuth credentials to {TOKEN_PATH}")
+                    _save_token(creds)
                 except Exception as e:
                     logger.error(f"Error with OAuth flow: {e}")
                     creds = None
@@ -141,32 +318,63 @@ async def spreadsheet_lifespan(server: FastMCP) -> AsyncIterator[SpreadsheetCont
     if not creds:
         try:
             logger.info("Attempting to use Application Default Credentials (ADC)")
-            creds, project = google.auth.default(scopes=SCOPES)
+            creds, project = google.auth.default(scopes=CONFIG.scopes)
             logger.info(f"Successfully authenticated using ADC for project: {project}")
         except Exception as e:
             logger.error(f"Error using Application Default Credentials: {e}")
             raise Exception("All authentication methods failed. Please configure credentials.")
     
-    # Build the services
+    # From here on, all refreshes (preemptive or on-demand) are single-flight
+    _install_single_flight_refresh(creds)
+
+    global _credentials
+    _credentials = creds
+
+    # Build the services; requests are executed through _execute, which
+    # hands each worker thread its own keep-alive connection, so the http
+    # passed here only backs service construction (no network with static
+    # discovery) and any stray direct execute()
     try:
-        sheets_service = build('sheets', 'v4', credentials=creds)
-        drive_service = build('drive', 'v3', credentials=creds)
+        # static_discovery uses the discovery documents bundled with
+        # googleapiclient, skipping two ~1MB discovery fetches at startup
+        authed_http = AuthorizedHttp(creds, http=httplib2.Http())
+        sheets_service = build('sheets', 'v4', http=authed_http,
+                               static_discovery=True, cache_discovery=False)
+        drive_service = build('drive', 'v3', http=authed_http,
+                              static_discovery=True, cache_discovery=False)
         logger.info("Successfully built Google API services")
     except Exception as e:
         logger.error(f"Error building Google API services: {e}")
         raise
     
-    try:
-        # Provide the service in the context
-        yield SpreadsheetContext(
-            sheets_service=sheets_service,
-            drive_service=drive_service,
-            folder_id=DRIVE_FOLDER_ID if DRIVE_FOLDER_ID else None
-        )
-        logger.info("Google Spreadsheet services initialized successfully")
-    finally:
-        # No explicit cleanup needed for Google APIs
-        logger.info("Cleaning up Google Spreadsheet services")
+    # Keep tokens fresh in the background so tool calls never refresh inline.
+    # The task (like the context) lives for the whole process, so it is held
+    # in a module global rather than cancelled when a session ends.
+    global _refresh_task
+    _refresh_task = asyncio.create_task(_refresh_loop(creds))
+
+    logger.info("Google Spreadsheet services initialized successfully")
+    return SpreadsheetContext(
+        sheets_service=sheets_service,
+        drive_service=drive_service,
+        folder_id=CONFIG.drive_folder_id if CONFIG.drive_folder_id else None
+    )
+
+
+@asynccontextmanager
+async def spreadsheet_lifespan(server: FastMCP) -> AsyncIterator[SpreadsheetContext]:
+    """Manage Google Spreadsheet API connection lifecycle.
+
+    The context is memoized at module scope: only the first session pays
+    for authentication and service construction, later sessions reuse it.
+    There is no per-session cleanup since the services hold no resources
+    that outlive the process.
+    """
+    global _context
+    async with _context_lock:
+        if _context is None:
+            _context = await _build_context()
+    yield _context
 
 
 # Initialize the MCP server with HTTP+Streamable transport
@@ -176,7 +384,7 @@ mcp = FastMCP(
     lifespan=spreadsheet_lifespan,
     # Enable HTTP server with Streamable HTTP transport
     host="0.0.0.0",  # Listen on all interfaces for cloud deployment
-    port=int(os.environ.get("PORT", 8000)),  # Use PORT env var for cloud deployment
+    port=CONFIG.port,  # Use PORT env var for cloud deployment
     # Streamable HTTP path for MCP communication
     streamable_http_path="/mcp",
     # Also enable SSE path for backward compatibility
@@ -184,30 +392,53 @@ mcp = FastMCP(
     # Enable JSON response mode for debugging
     json_response=True,
     # Additional debugging
-    debug=os.environ.get("DEBUG", "false").lower() == "true"
+    debug=CONFIG.debug
 )
 
-# Add a simple health check endpoint 
-@mcp.tool()
-def health_check() -> Dict[str, Any]:
-    """Health check endpoint"""
-    return {"status": "healthy", "service": "Google Sheets MCP Server"}
+@lru_cache(maxsize=4096)
+def _a1(sheet: str, rng: Optional[str]) -> str:
+    """Build an A1 reference, quoting the sheet name when required.
+
+    Sheet names containing spaces, quotes or '!' must be single-quoted
+    (with embedded quotes doubled) or the Sheets API misparses the range.
+    Cached since hot repeat-read paths rebuild identical references.
+    """
+    if any(c in sheet for c in " '!"):
+        quoted = "'" + sheet.replace("'", "''") + "'"
+    else:
+        quoted = sheet
+    return f"{quoted}!{rng}" if rng else quoted
+
+
+def _services(ctx: Context) -> SpreadsheetContext:
+    """Resolve the lifespan context once per tool call.
+
+    Every tool needs one or more of sheets_service/drive_service/folder_id;
+    walking ctx.request_context.lifespan_context per attribute costs four
+    chained lookups each time, so resolve it once and read slots off it.
+    """
+    return ctx.request_context.lifespan_context
+
 
 # Log authentication setup
 logger.info("API Key authentication will be handled at deployment level")
-logger.info(f"For direct access, use X-API-Key header with value: {API_KEY}")
+logger.info(f"For direct access, use X-API-Key header with value: {CONFIG.api_key}")
 
 
 # Google Sheets tools implementation
 @mcp.tool()
-def get_sheet_data(spreadsheet_id: str, 
-                   sheet: str,
-                   range: Optional[str] = None,
-                   include_grid_data: bool = False,
-                   ctx: Context = None) -> Dict[str, Any]:
+async def get_sheet_data(spreadsheet_id: str,
+                         sheet: str,
+                         range: Optional[str] = None,
+                         include_grid_data: bool = False,
+                         start_row: Optional[int] = None,
+                         max_rows: Optional[int] = None,
+                         value_render_option: str = 'UNFORMATTED_VALUE',
+                         date_time_render_option: str = 'SERIAL_NUMBER',
+                         ctx: Context = None) -> Dict[str, Any]:
     """
     Get data from a specific sheet in a Google Spreadsheet.
-    
+
     Args:
         spreadsheet_id: The ID of the spreadsheet (found in the URL)
         sheet: The name of the sheet
@@ -216,41 +447,60 @@ def get_sheet_data(spreadsheet_id: str,
             Note: Setting this to True will significantly increase the response size and token usage
             when parsing the response, as it includes detailed cell formatting information.
             Default is False (returns values only, more efficient).
-    
+        start_row: Optional 1-based first row to read. Only used when range is not provided.
+        max_rows: Optional maximum number of rows to read, starting at start_row (default row 1).
+            Use start_row/max_rows to page through large sheets in bounded chunks instead of
+            buffering the whole sheet in one response. Only used when range is not provided.
+        value_render_option: How values are rendered: 'UNFORMATTED_VALUE' (default, raw
+            numbers/strings - smaller and faster), 'FORMATTED_VALUE' (display strings as
+            shown in the UI), or 'FORMULA'. Ignored when include_grid_data is True.
+        date_time_render_option: How dates/times are rendered when values are unformatted:
+            'SERIAL_NUMBER' (default) or 'FORMATTED_STRING'. Ignored when include_grid_data
+            is True or value_render_option is 'FORMATTED_VALUE'.
+
     Returns:
         Grid data structure with either full metadata or just values from Google Sheets API, depending on include_grid_data parameter
     """
-    sheets_service = ctx.request_context.lifespan_context.sheets_service
+    sheets_service = _services(ctx).sheets_service
 
     # Construct the range - keep original API behavior
     if range:
-        full_range = f"{sheet}!{range}"
+        full_range = _a1(sheet, range)
+    elif start_row or max_rows:
+        # Row-bounded page of the sheet; keeps memory at O(page) for big sheets.
+        # The Sheets API clips out-of-bounds rows, so an oversized end is safe.
+        first = start_row or 1
+        last = first + max_rows - 1 if max_rows else 10_000_000
+        full_range = _a1(sheet, f"{first}:{last}")
     else:
-        full_range = sheet
+        full_range = _a1(sheet, None)
     
     try:
         if include_grid_data:
             # Use full API to get all grid data including formatting
-            result = sheets_service.spreadsheets().get(
+            request = sheets_service.spreadsheets().get(
                 spreadsheetId=spreadsheet_id,
                 ranges=[full_range],
-                includeGridData=True
-            ).execute()
+                includeGridData=True,
+                fields='spreadsheetId,sheets(properties.title,'
+                       'data(rowData.values(effectiveValue,formattedValue,userEnteredFormat)))'
+            )
+            result = await _execute(request)
         else:
-            # Use values API to get cell values only (more efficient)
-            values_result = sheets_service.spreadsheets().values().get(
+            # Use values API to get cell values only (more efficient).
+            # batchGet natively returns {'spreadsheetId', 'valueRanges': [...]},
+            # so the (possibly large) values list is never copied into a
+            # Python-side wrapper before serialization.
+            # Raw values skip the server-side formatter and encode shorter
+            # than their locale-formatted display strings
+            request = sheets_service.spreadsheets().values().batchGet(
                 spreadsheetId=spreadsheet_id,
-                range=full_range
-            ).execute()
-            
-            # Format the response to match expected structure
-            result = {
-                'spreadsheetId': spreadsheet_id,
-                'valueRanges': [{
-                    'range': full_range,
-                    'values': values_result.get('values', [])
-                }]
-            }
+                ranges=[full_range],
+                majorDimension='ROWS',
+                valueRenderOption=value_render_option,
+                dateTimeRenderOption=date_time_render_option
+            )
+            result = await _execute(request)
 
         logger.info(f"Successfully retrieved data from {spreadsheet_id}, sheet: {sheet}, range: {range or 'all'}")
         return result
@@ -259,52 +509,167 @@ def get_sheet_data(spreadsheet_id: str,
         raise
 
 
+def _gzip_request_body(request):
+    """Gzip a large JSON request body in place before it goes on the wire.
+
+    Spreadsheet payloads are highly repetitive, so bulk update/append bodies
+    typically shrink 5-10x; Google's APIs accept Content-Encoding: gzip.
+    Responses are already gzip-negotiated by httplib2. Small bodies are
+    left untouched.
+    """
+    body = request.body
+    if body is None:
+        return request
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    if len(body) < GZIP_MIN_BODY_BYTES:
+        return request
+    request.body = gzip.compress(body, compresslevel=1)
+    request.headers['content-encoding'] = 'gzip'
+    request.headers['content-length'] = str(len(request.body))
+    return request
+
+
+def _build_values_request(method, body: Dict[str, Any], **kwargs):
+    """Build a values write request with a fast-encoded body.
+
+    googleapiclient serializes `body` with stdlib json at request-build time,
+    and for bulk uploads that per-cell encode dominates the call. When orjson
+    is installed the request is built with a placeholder body and the real
+    payload is encoded by orjson straight into the request instead. The body
+    is then gzipped if large enough.
+    """
+    if orjson is None:
+        request = method(body=body, **kwargs)
+    else:
+        request = method(body={}, **kwargs)
+        request.body = orjson.dumps(body)
+        # The request was built around the placeholder body, so its size
+        # bookkeeping is stale; fix it or execute() advertises a 2-byte
+        # content-length and truncates the payload on the wire
+        request.body_size = len(request.body)
+        request.headers['content-length'] = str(request.body_size)
+    return _gzip_request_body(request)
+
+
+async def _values_batch_update(sheets_service,
+                               spreadsheet_id: str,
+                               updates: Dict[str, List[List[Any]]]) -> Dict[str, Any]:
+    """Write several A1 ranges in one values.batchUpdate round trip."""
+    request = _build_values_request(
+        sheets_service.spreadsheets().values().batchUpdate,
+        {
+            'valueInputOption': 'USER_ENTERED',
+            'data': [{'range': r, 'values': v} for r, v in updates.items()]
+        },
+        spreadsheetId=spreadsheet_id,
+        fields='spreadsheetId,totalUpdatedRows,totalUpdatedColumns,totalUpdatedCells,'
+               'responses(spreadsheetId,updatedRange,updatedRows,updatedColumns,updatedCells)'
+    )
+    return await _execute(request)
+
+
 @mcp.tool()
-def update_cells(spreadsheet_id: str,
-                sheet: str,
-                range: str,
-                data: List[List[Any]],
-                ctx: Context = None) -> Dict[str, Any]:
+async def update_cells(spreadsheet_id: str,
+                       sheet: str,
+                       range: str,
+                       data: List[List[Any]],
+                       ctx: Context = None) -> Dict[str, Any]:
     """
     Update cells in a Google Spreadsheet.
-    
+
     Args:
         spreadsheet_id: The ID of the spreadsheet (found in the URL)
         sheet: The name of the sheet
         range: Cell range in A1 notation (e.g., 'A1:C10')
         data: 2D array of values to update
-    
+
     Returns:
         Result of the update operation
     """
-    sheets_service = ctx.request_context.lifespan_context.sheets_service
-    
+    sheets_service = _services(ctx).sheets_service
+
     # Construct the range
-    full_range = f"{sheet}!{range}"
-    
-    # Prepare the value range object
-    value_range_body = {
-        'values': data
-    }
-    
+    full_range = _a1(sheet, range)
+
     try:
-        # Call the Sheets API to update values
-        result = sheets_service.spreadsheets().values().update(
-            spreadsheetId=spreadsheet_id,
-            range=full_range,
-            valueInputOption='USER_ENTERED',
-            body=value_range_body
-        ).execute()
-        
+        # Thin shim over the batch path with a single range
+        result = await _values_batch_update(sheets_service, spreadsheet_id,
+                                            {full_range: data})
+
         logger.info(f"Successfully updated cells in {spreadsheet_id}, sheet: {sheet}, range: {range}")
-        return result
+        return result['responses'][0]
     except Exception as e:
         logger.error(f"Error updating cells: {e}")
         raise
 
 
 @mcp.tool()
-def create_spreadsheet(title: str, ctx: Context = None) -> Dict[str, Any]:
+async def update_cells_batch(spreadsheet_id: str,
+                             updates: Dict[str, List[List[Any]]],
+                             ctx: Context = None) -> Dict[str, Any]:
+    """
+    Update multiple cell ranges in a Google Spreadsheet with a single API call.
+
+    Args:
+        spreadsheet_id: The ID of the spreadsheet (found in the URL)
+        updates: Mapping of A1 ranges (including sheet name, e.g. 'Sheet1!A1:C10')
+            to the 2D array of values for that range
+
+    Returns:
+        Result of the batch update operation, including per-range responses
+    """
+    sheets_service = _services(ctx).sheets_service
+
+    try:
+        result = await _values_batch_update(sheets_service, spreadsheet_id, updates)
+
+        logger.info(f"Successfully updated {len(updates)} ranges in {spreadsheet_id}")
+        return result
+    except Exception as e:
+        logger.error(f"Error batch updating cells: {e}")
+        raise
+
+
+@mcp.tool()
+async def get_sheet_data_batch(spreadsheet_id: str,
+                               ranges: List[str],
+                               value_render_option: str = 'UNFORMATTED_VALUE',
+                               date_time_render_option: str = 'SERIAL_NUMBER',
+                               ctx: Context = None) -> Dict[str, Any]:
+    """
+    Get data from multiple ranges of a Google Spreadsheet with a single API call.
+
+    Args:
+        spreadsheet_id: The ID of the spreadsheet (found in the URL)
+        ranges: List of A1 ranges to read (including sheet name, e.g. 'Sheet1!A1:C10')
+        value_render_option: How values are rendered; see get_sheet_data
+        date_time_render_option: How dates/times are rendered; see get_sheet_data
+
+    Returns:
+        Grid data with one valueRanges entry per requested range
+    """
+    sheets_service = _services(ctx).sheets_service
+
+    try:
+        request = sheets_service.spreadsheets().values().batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=ranges,
+            majorDimension='ROWS',
+            valueRenderOption=value_render_option,
+            dateTimeRenderOption=date_time_render_option
+        )
+        result = await _execute(request)
+
+        logger.info(f"Successfully retrieved {len(ranges)} ranges from {spreadsheet_id}")
+        return result
+    except Exception as e:
+        logger.error(f"Error getting batch sheet data: {e}")
+        raise
+
+
+@mcp.tool()
+async def create_spreadsheet(title: str, ctx: Context = None) -> Dict[str, Any]:
     """
     Create a new Google Spreadsheet.
     
@@ -314,8 +679,9 @@ def create_spreadsheet(title: str, ctx: Context = None) -> Dict[str, Any]:
     Returns:
         Information about the newly created spreadsheet including its ID
     """
-    drive_service = ctx.request_context.lifespan_context.drive_service
-    folder_id = ctx.request_context.lifespan_context.folder_id
+    svc = _services(ctx)
+    drive_service = svc.drive_service
+    folder_id = svc.folder_id
 
     # Create the spreadsheet
     file_body = {
@@ -326,11 +692,12 @@ def create_spreadsheet(title: str, ctx: Context = None) -> Dict[str, Any]:
         file_body['parents'] = [folder_id]
     
     try:
-        spreadsheet = drive_service.files().create(
+        request = drive_service.files().create(
             supportsAllDrives=True,
             body=file_body,
             fields='id, name, parents'
-        ).execute()
+        )
+        spreadsheet = await _execute(request)
 
         spreadsheet_id = spreadsheet.get('id')
         parents = spreadsheet.get('parents')
@@ -348,7 +715,7 @@ def create_spreadsheet(title: str, ctx: Context = None) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def list_spreadsheets(ctx: Context = None) -> List[Dict[str, str]]:
+async def list_spreadsheets(ctx: Context = None) -> List[Dict[str, str]]:
     """
     List all spreadsheets in the configured Google Drive folder.
     If no folder is configured, lists spreadsheets from 'My Drive'.
@@ -356,8 +723,9 @@ def list_spreadsheets(ctx: Context = None) -> List[Dict[str, str]]:
     Returns:
         List of spreadsheets with their ID and title
     """
-    drive_service = ctx.request_context.lifespan_context.drive_service
-    folder_id = ctx.request_context.lifespan_context.folder_id
+    svc = _services(ctx)
+    drive_service = svc.drive_service
+    folder_id = svc.folder_id
     
     query = "mimeType='application/vnd.google-apps.spreadsheet'"
     
@@ -369,18 +737,24 @@ def list_spreadsheets(ctx: Context = None) -> List[Dict[str, str]]:
         logger.info("Searching for spreadsheets in 'My Drive'")
     
     try:
-        # List spreadsheets
-        results = drive_service.files().list(
+        # List spreadsheets, following pagination. Drive defaults to 100
+        # items per page; ask for the maximum so most folders fit in one
+        # round trip, and walk nextPageToken for the rest.
+        spreadsheets = []
+        request = drive_service.files().list(
             q=query,
             spaces='drive',
             includeItemsFromAllDrives=True,
             supportsAllDrives=True,
-            fields='files(id, name)',
+            pageSize=1000,
+            fields='nextPageToken, files(id, name)',
             orderBy='modifiedTime desc'
-        ).execute()
-        
-        spreadsheets = results.get('files', [])
-        
+        )
+        while request is not None:
+            results = await _execute(request)
+            spreadsheets.extend(results.get('files', []))
+            request = drive_service.files().list_next(request, results)
+
         logger.info(f"Found {len(spreadsheets)} spreadsheets")
         return [{'id': sheet['id'], 'title': sheet['name']} for sheet in spreadsheets]
     except Exception as e:
@@ -389,10 +763,10 @@ def list_spreadsheets(ctx: Context = None) -> List[Dict[str, str]]:
 
 
 @mcp.tool()
-def add_rows(spreadsheet_id: str,
-             sheet: str,
-             data: List[List[Any]],
-             ctx: Context = None) -> Dict[str, Any]:
+async def add_rows(spreadsheet_id: str,
+                   sheet: str,
+                   data: List[List[Any]],
+                   ctx: Context = None) -> Dict[str, Any]:
     """
     Append rows to the end of a sheet (after the last row with data).
     
@@ -404,7 +778,7 @@ def add_rows(spreadsheet_id: str,
     Returns:
         Result of the append operation
     """
-    sheets_service = ctx.request_context.lifespan_context.sheets_service
+    sheets_service = _services(ctx).sheets_service
     
     # Prepare the value range object
     value_range_body = {
@@ -413,13 +787,16 @@ def add_rows(spreadsheet_id: str,
     
     try:
         # Call the Sheets API to append values
-        result = sheets_service.spreadsheets().values().append(
+        request = _build_values_request(
+            sheets_service.spreadsheets().values().append,
+            value_range_body,
             spreadsheetId=spreadsheet_id,
-            range=sheet,
+            range=_a1(sheet, None),
             valueInputOption='USER_ENTERED',
-            body=value_range_body
-        ).execute()
-        
+            fields='spreadsheetId,updates(updatedRange,updatedRows,updatedCells)'
+        )
+        result = await _execute(request)
+
         logger.info(f"Successfully added {len(data)} rows to {spreadsheet_id}, sheet: {sheet}")
         return result
     except Exception as e:
@@ -428,7 +805,7 @@ def add_rows(spreadsheet_id: str,
 
 
 @mcp.tool()
-def list_sheets(spreadsheet_id: str, ctx: Context = None) -> List[str]:
+async def list_sheets(spreadsheet_id: str, ctx: Context = None) -> List[str]:
     """
     List all sheets in a Google Spreadsheet.
     
@@ -438,15 +815,27 @@ def list_sheets(spreadsheet_id: str, ctx: Context = None) -> List[str]:
     Returns:
         List of sheet names
     """
-    sheets_service = ctx.request_context.lifespan_context.sheets_service
-    
+    svc = _services(ctx)
+    sheets_service = svc.sheets_service
+    cache = svc.sheet_names_cache
+
+    # Serve from the TTL cache when fresh to skip the metadata round trip
+    cached = cache.get(spreadsheet_id)
+    if cached and time.monotonic() - cached[0] < SHEET_NAMES_CACHE_TTL:
+        return cached[1]
+
     try:
-        # Get spreadsheet metadata
-        spreadsheet = sheets_service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
-        
+        # Get spreadsheet metadata (titles only)
+        request = sheets_service.spreadsheets().get(
+            spreadsheetId=spreadsheet_id,
+            fields='sheets.properties.title'
+        )
+        spreadsheet = await _execute(request)
+
         # Extract sheet names
         sheet_names = [sheet['properties']['title'] for sheet in spreadsheet['sheets']]
-        
+        cache[spreadsheet_id] = (time.monotonic(), sheet_names)
+
         logger.info(f"Found {len(sheet_names)} sheets in spreadsheet {spreadsheet_id}")
         return sheet_names
     except Exception as e:
@@ -455,9 +844,9 @@ def list_sheets(spreadsheet_id: str, ctx: Context = None) -> List[str]:
 
 
 @mcp.tool()
-def create_sheet(spreadsheet_id: str, 
-                title: str, 
-                ctx: Context = None) -> Dict[str, Any]:
+async def create_sheet(spreadsheet_id: str,
+                       title: str,
+                       ctx: Context = None) -> Dict[str, Any]:
     """
     Create a new sheet tab in an existing Google Spreadsheet.
     
@@ -468,8 +857,9 @@ def create_sheet(spreadsheet_id: str,
     Returns:
         Information about the newly created sheet
     """
-    sheets_service = ctx.request_context.lifespan_context.sheets_service
-    
+    svc = _services(ctx)
+    sheets_service = svc.sheets_service
+
     # Define the add sheet request
     request_body = {
         "requests": [
@@ -485,14 +875,19 @@ def create_sheet(spreadsheet_id: str,
     
     try:
         # Execute the request
-        result = sheets_service.spreadsheets().batchUpdate(
+        request = sheets_service.spreadsheets().batchUpdate(
             spreadsheetId=spreadsheet_id,
-            body=request_body
-        ).execute()
+            body=request_body,
+            fields='replies.addSheet.properties(sheetId,title,index)'
+        )
+        result = await _execute(request)
         
         # Extract the new sheet information
         new_sheet_props = result['replies'][0]['addSheet']['properties']
-        
+
+        # The sheet list changed; drop any cached names for this spreadsheet
+        svc.sheet_names_cache.pop(spreadsheet_id, None)
+
         logger.info(f"Created new sheet '{title}' in spreadsheet {spreadsheet_id}")
         return {
             'sheetId': new_sheet_props['sheetId'],
@@ -505,31 +900,52 @@ def create_sheet(spreadsheet_id: str,
         raise
 
 
+# Constant payload: liveness probes hit this every few seconds, so avoid
+# rebuilding the same dict on every call
+_HEALTH = {
+    "status": "healthy",
+    "service": "Google Sheets MCP Server",
+    "version": "1.0.0"
+}
+
+
 # Health check endpoint for deployment
 @mcp.tool()
 def health_check() -> Dict[str, str]:
     """
     Health check endpoint for deployment monitoring.
-    
+
     Returns:
         Status information about the server
     """
-    return {
-        "status": "healthy",
-        "service": "Google Sheets MCP Server",
-        "version": "1.0.0"
-    }
+    return _HEALTH
+
+
+def streamable_http_app():
+    """ASGI app factory for uvicorn (and any external ASGI server)."""
+    return mcp.streamable_http_app()
 
 
 def main():
     """Main entry point for the server."""
     logger.info("Starting Google Sheets MCP Server with HTTP+Streamable transport")
-    logger.info(f"Server will listen on 0.0.0.0:{os.environ.get('PORT', 8000)}")
+    logger.info(f"Server will listen on 0.0.0.0:{CONFIG.port}")
     logger.info("Streamable HTTP endpoint: /mcp")
     logger.info("SSE endpoint: /sse")
-    
-    # Run the server in streamable HTTP mode
-    mcp.run(transport="streamable-http")
+
+    # Serve the ASGI app with uvicorn directly instead of mcp.run();
+    # loop/http 'auto' picks the C implementations (uvloop, httptools)
+    # when installed and falls back to the stdlib stack otherwise
+    uvicorn.run(
+        "google_sheets_mcp_server.server:streamable_http_app",
+        factory=True,
+        host="0.0.0.0",
+        port=CONFIG.port,
+        loop="auto",
+        http="auto",
+        log_level="debug" if CONFIG.debug else "info",
+        workers=CONFIG.workers,
+    )
 
 
 if __name__ == "__main__":